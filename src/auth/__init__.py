@@ -37,10 +37,14 @@ from .routers import (
     hash_password,
 )
 from .sql import (
+    add_missing_user_columns,
     create_user,
     get_user_by_username,
 )
+from .audit import AUDIT_WRITER
 from .events import *
+from .keys import TOKEN_SIGNER
+from .login_tracker import LOGIN_TRACKER
 
 # Create admin user
 async def create_admin(
@@ -65,6 +69,7 @@ async def lifespan(__app: FastAPI):
         try:
             logger.info("[LOG:AUTH] - Creating database tables")
             async with Engine.begin() as conn:
+                await conn.run_sync(add_missing_user_columns)
                 await conn.run_sync(Base.metadata.create_all)
             logger.info("[LOG:AUTH] - Creating default admin.")
             async with SessionLocal() as db:
@@ -84,6 +89,15 @@ async def lifespan(__app: FastAPI):
                 f"[LOG:WAREHOUSE] - Could not start RabbitMQ listeners: {e}",
                 exc_info=True
             )
+        logger.info("[LOG:AUTH] - Starting token signer")
+        try:
+            await TOKEN_SIGNER.start()
+        except Exception as e:
+            logger.error(f"[LOG:AUTH] - Could not start token signer: {e}", exc_info=True)
+        logger.info("[LOG:AUTH] - Starting login tracker")
+        await LOGIN_TRACKER.start()
+        logger.info("[LOG:AUTH] - Starting audit writer")
+        await AUDIT_WRITER.start()
         logger.info("[LOG:AUTH] - Registering service to Consul...")
         try:
             CONSUL_CLIENT.register_service(
@@ -95,6 +109,12 @@ async def lifespan(__app: FastAPI):
             logger.error(f"[LOG:AUTH] - Failed to register with Consul: Reason={e}", exc_info=True)
         yield
     finally:
+        logger.info("[LOG:AUTH] - Stopping token signer")
+        await TOKEN_SIGNER.stop()
+        logger.info("[LOG:AUTH] - Flushing login tracker")
+        await LOGIN_TRACKER.stop()
+        logger.info("[LOG:AUTH] - Flushing audit writer")
+        await AUDIT_WRITER.stop()
         logger.info("[LOG:AUTH] - Shutting down database")
         CONSUL_CLIENT.deregister_service()
         await Engine.dispose()
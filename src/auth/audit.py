@@ -0,0 +1,158 @@
+from .sql import (
+    create_audit_events,
+    delete_audit_events_before,
+)
+from chassis.sql import SessionLocal
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from threading import Lock
+from typing import Optional
+import asyncio
+import logging
+import os
+import time
+
+__all__: list[str] = [
+    "AUDIT_WRITER",
+    "AuditWriter",
+]
+
+logger = logging.getLogger(__name__)
+
+class AuditWriter:
+    """Append-only audit trail written in batches.
+
+    ``record`` only appends to an in-memory buffer, so request handlers never
+    wait on a commit. A background task inserts the buffer once it holds
+    ``batch_size`` events or every ``flush_interval_ms``, whichever comes
+    first, and deletes events older than ``retention_days`` every
+    ``prune_interval`` seconds. If the database stays unavailable the buffer
+    keeps at most ``max_buffer`` events, dropping the oldest. ``record`` is
+    thread-safe so the RabbitMQ listener threads can use it too.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        flush_interval_ms: int = 500,
+        retention_days: int = 90,
+        prune_interval: float = 3600.0,
+        max_buffer: int = 10000,
+    ) -> None:
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._retention = timedelta(days=retention_days)
+        self._prune_interval = prune_interval
+        self._max_buffer = max_buffer
+        self._buffer: list[dict] = []
+        self._dropped = 0
+        self._lock = Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        if self._writer is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._writer = asyncio.create_task(self._write_periodically())
+        logger.info(
+            f"[LOG:AUTH] - Audit writer started: batch_size={self._batch_size}, "
+            f"flush_interval={self._flush_interval}s, retention={self._retention}"
+        )
+
+    async def stop(self) -> None:
+        if self._writer is None or self._wake is None:
+            return
+        # Let the writer finish its current flush instead of cancelling mid-commit
+        self._stopping = True
+        self._wake.set()
+        await self._writer
+        self._writer = self._wake = self._loop = None
+        logger.info("[LOG:AUTH] - Audit writer stopped")
+
+    def record(
+        self,
+        event: str,
+        user_id: Optional[int] = None,
+        detail: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._buffer.append({
+                "user_id": user_id,
+                "event": event,
+                "detail": detail,
+                "created_at": datetime.now(timezone.utc),
+            })
+            self._trim_buffer()
+            full = len(self._buffer) >= self._batch_size
+        loop, wake = self._loop, self._wake
+        if full and loop is not None and wake is not None:
+            loop.call_soon_threadsafe(wake.set)
+
+    async def flush(self) -> None:
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            logger.warning(f"[LOG:AUTH] - Audit buffer full, oldest events dropped: count={dropped}")
+        if not rows:
+            return
+        try:
+            async with SessionLocal() as db:
+                await create_audit_events(db, rows)
+        except Exception as e:
+            with self._lock:
+                self._buffer[:0] = rows
+                self._trim_buffer()
+            logger.error(f"[LOG:AUTH] - Could not write audit events: {e}", exc_info=True)
+            return
+        logger.debug(f"[LOG:AUTH] - Audit events written: count={len(rows)}")
+
+    async def prune(self) -> None:
+        cutoff = datetime.now(timezone.utc) - self._retention
+        try:
+            async with SessionLocal() as db:
+                deleted = await delete_audit_events_before(db, cutoff)
+        except Exception as e:
+            logger.error(f"[LOG:AUTH] - Could not prune audit events: {e}", exc_info=True)
+            return
+        if deleted:
+            logger.info(f"[LOG:AUTH] - Audit events pruned: count={deleted}, cutoff={cutoff.isoformat()}")
+
+    def _trim_buffer(self) -> None:
+        # Caller holds self._lock; the drop count is logged by the next flush
+        if (overflow := len(self._buffer) - self._max_buffer) > 0:
+            del self._buffer[:overflow]
+            self._dropped += overflow
+
+    async def _write_periodically(self) -> None:
+        assert self._wake is not None
+        next_prune = time.monotonic()
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+            if not self._stopping and time.monotonic() >= next_prune:
+                await self.prune()
+                next_prune = time.monotonic() + self._prune_interval
+        # Events recorded during the last write
+        await self.flush()
+
+
+AUDIT_WRITER = AuditWriter(
+    batch_size=int(os.getenv("AUDIT_BATCH_SIZE", "100")),
+    flush_interval_ms=int(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "500")),
+    retention_days=int(os.getenv("AUDIT_RETENTION_DAYS", "90")),
+    prune_interval=float(os.getenv("AUDIT_PRUNE_INTERVAL", "3600")),
+    max_buffer=int(os.getenv("AUDIT_MAX_BUFFER", "10000")),
+)
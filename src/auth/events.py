@@ -1,5 +1,7 @@
+from .audit import AUDIT_WRITER
 from .global_vars import LISTENING_QUEUES
 from .sql import (
+    AuditEvent,
     update_status,
     User,
 )
@@ -21,4 +23,6 @@ async def piece_request(message: MessageType) -> None:
     async with SessionLocal() as db:
         await update_status(db, client_id, User.STATUS_SUSPENDED)
 
+    AUDIT_WRITER.record(AuditEvent.EVENT_SUSPENDED, client_id, "honeypot.compromised")
+
     logger.warning(f"[EVENT:USER:SUSPENDED] - client_id={client_id}")
\ No newline at end of file
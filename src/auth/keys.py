@@ -17,15 +17,23 @@ from datetime import (
     timedelta, 
     timezone,
 )
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
+import asyncio
 import jwt
+import logging
 import os
+import time
 
 __all__: list[str] = [
-    "JWTRSAProvider"
+    "JWTRSAProvider",
+    "TOKEN_SIGNER",
+    "TokenSigner",
 ]
 
+logger = logging.getLogger(__name__)
+
 RABBITMQ_CONFIG: RabbitMQConfig = {
     "host": os.getenv("RABBITMQ_HOST", "localhost"),
     "port": int(os.getenv("RABBITMQ_PORT", "5672")),
@@ -75,30 +83,42 @@ class JWTRSAProvider:
         role: str,
         minutes: int, # 15
     ) -> str:
-        assert JWTRSAProvider._private_key is not None, "A private key should be created before calling this function."
-        payload = {
+        return JWTRSAProvider.sign(JWTRSAProvider.access_payload(user_id, role, minutes))
+    
+    @staticmethod
+    def create_refresh_token(
+        user_id: int,
+        days: int, # 7
+    ) -> str:
+        return JWTRSAProvider.sign(JWTRSAProvider.refresh_payload(user_id, days))
+
+    @staticmethod
+    def access_payload(
+        user_id: int,
+        role: str,
+        minutes: int,
+    ) -> dict:
+        return {
             "sub": str(user_id),
             "exp": datetime.now(timezone.utc) + timedelta(minutes=minutes),
             "role": role,
             "type": "access"
         }
-        return jwt.encode(
-            payload=payload,
-            key=JWTRSAProvider._private_key,
-            algorithm=JWTRSAProvider._algorithm,
-        )
-    
+
     @staticmethod
-    def create_refresh_token(
+    def refresh_payload(
         user_id: int,
-        days: int, # 7
-    ) -> str:
-        assert JWTRSAProvider._private_key is not None, "A private key should be created before calling this function."
-        payload = {
+        days: int,
+    ) -> dict:
+        return {
             "sub": str(user_id),
             "exp": datetime.now(timezone.utc) + timedelta(days=days),
             "type": "refresh",
         }
+
+    @staticmethod
+    def sign(payload: dict) -> str:
+        assert JWTRSAProvider._private_key is not None, "A private key should be created before calling this function."
         return jwt.encode(
             payload=payload,
             key=JWTRSAProvider._private_key,
@@ -147,5 +167,207 @@ class JWTRSAProvider:
                     "public_key": "AVAILABLE"
                 },
             )
-        
-    
\ No newline at end of file
+
+
+class _LatencyStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class TokenSigner:
+    """Signs JWTs on a thread pool so the RSA work stays off the event loop.
+
+    Requests are put on a bounded queue; a dispatcher task drains whatever has
+    accumulated (up to ``batch_size``) and splits it across the idle workers
+    without waiting for earlier batches to finish. OpenSSL releases the GIL
+    while signing, so a burst of logins is signed in parallel. With
+    ``workers=0`` or before ``start()`` tokens are signed inline.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int = 256,
+        batch_size: int = 32,
+    ) -> None:
+        self._workers = workers
+        self._queue_size = queue_size
+        self._batch_size = batch_size
+        self._queue: Optional[asyncio.Queue[tuple[dict, asyncio.Future[str], float]]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._in_flight: set[asyncio.Task] = set()
+        self._closed = False
+        self._queue_wait = _LatencyStats()
+        self._signing = _LatencyStats()
+        self._batches = 0
+        self._batched = 0
+        self._max_batch = 0
+
+    @property
+    def running(self) -> bool:
+        return self._dispatcher is not None
+
+    async def start(self) -> None:
+        if self._workers <= 0 or self.running:
+            return
+        self._closed = False
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers,
+            thread_name_prefix="jwt-signer",
+        )
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        logger.info(
+            f"[LOG:AUTH] - Token signer started: workers={self._workers}, "
+            f"queue_size={self._queue_size}, batch_size={self._batch_size}"
+        )
+
+    async def stop(self) -> None:
+        if self._dispatcher is None:
+            return
+        self._closed = True
+        self._dispatcher.cancel()
+        try:
+            await self._dispatcher
+        except asyncio.CancelledError:
+            pass
+        for task in self._in_flight:
+            task.cancel()
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+        assert self._queue is not None and self._executor is not None
+        # Each get wakes one caller blocked on a full queue; it puts its item, sees
+        # _closed and cancels itself. Keep draining until no late putter is left.
+        while not self._queue.empty():
+            while not self._queue.empty():
+                _, future, _ = self._queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+            await asyncio.sleep(0)
+        self._executor.shutdown(wait=True)
+        self._dispatcher = self._queue = self._executor = None
+        logger.info("[LOG:AUTH] - Token signer stopped")
+
+    async def sign(self, payload: dict) -> str:
+        if self._queue is None or self._closed:
+            return JWTRSAProvider.sign(payload)
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future, time.perf_counter()))
+        if self._closed and not future.done():
+            # Stopped while waiting for room; nothing reads the queue any more
+            future.cancel()
+        return await future
+
+    async def create_access_token(
+        self,
+        user_id: int,
+        role: str,
+        minutes: int,
+    ) -> str:
+        return await self.sign(JWTRSAProvider.access_payload(user_id, role, minutes))
+
+    async def create_refresh_token(
+        self,
+        user_id: int,
+        days: int,
+    ) -> str:
+        return await self.sign(JWTRSAProvider.refresh_payload(user_id, days))
+
+    def get_metrics(self) -> dict:
+        return {
+            "running": self.running,
+            "workers": self._workers,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "batches": {
+                "count": self._batches,
+                "avg_size": round(self._batched / self._batches, 2) if self._batches else 0.0,
+                "max_size": self._max_batch,
+            },
+            "queue_wait": self._queue_wait.snapshot(),
+            "signing": self._signing.snapshot(),
+        }
+
+    async def _dispatch(self) -> None:
+        assert self._queue is not None
+        free_workers = asyncio.Semaphore(self._workers)
+        while True:
+            # Requests keep piling up in the queue while every worker is busy
+            first = await self._queue.get()
+            try:
+                await free_workers.acquire()
+            except asyncio.CancelledError:
+                first[1].cancel()
+                raise
+            batch = [first]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            permits = 1
+            while permits < len(batch) and not free_workers.locked():
+                await free_workers.acquire()
+                permits += 1
+
+            now = time.perf_counter()
+            for _, _, enqueued_at in batch:
+                self._queue_wait.add(now - enqueued_at)
+            self._batches += 1
+            self._batched += len(batch)
+            self._max_batch = max(self._max_batch, len(batch))
+
+            for i in range(permits):
+                task = asyncio.create_task(self._sign_chunk(batch[i::permits]))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+                task.add_done_callback(lambda _: free_workers.release())
+
+    async def _sign_chunk(self, chunk: list[tuple[dict, asyncio.Future[str], float]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor,
+                TokenSigner._sign_payloads,
+                [payload for payload, _, _ in chunk],
+            )
+        except asyncio.CancelledError:
+            for _, future, _ in chunk:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"[LOG:AUTH] - Token signing failed: {e}", exc_info=True)
+            for _, future, _ in chunk:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future, _), (token, elapsed) in zip(chunk, results):
+            self._signing.add(elapsed)
+            if not future.done():
+                future.set_result(token)
+
+    @staticmethod
+    def _sign_payloads(payloads: list[dict]) -> list[tuple[str, float]]:
+        results = []
+        for payload in payloads:
+            started_at = time.perf_counter()
+            token = JWTRSAProvider.sign(payload)
+            results.append((token, time.perf_counter() - started_at))
+        return results
+
+
+TOKEN_SIGNER = TokenSigner(
+    workers=int(os.getenv("JWT_SIGNER_WORKERS", "0")),
+    queue_size=int(os.getenv("JWT_SIGNER_QUEUE_SIZE", "256")),
+    batch_size=int(os.getenv("JWT_SIGNER_BATCH_SIZE", "32")),
+)
@@ -0,0 +1,171 @@
+from .sql import (
+    update_login_stats,
+    User,
+)
+from chassis.sql import SessionLocal
+from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from typing import Optional
+import asyncio
+import logging
+import os
+
+__all__: list[str] = [
+    "LOGIN_TRACKER",
+    "LoginTracker",
+]
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class _LoginState:
+    failed_attempts: int = 0
+    last_login: Optional[datetime] = None
+    locked_until: Optional[datetime] = None
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite drops the timezone on read
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class LoginTracker:
+    """Keeps failed-login counters and lockouts in memory.
+
+    The state of a user is seeded from the ``User`` row already loaded by
+    ``login``, so lockout checks add no query. Changes are marked dirty and
+    written back every ``flush_interval`` seconds in a single batched UPDATE.
+    Entries left clean by a flush are dropped one cycle later, so a ``User``
+    row read before that flush committed cannot re-seed stale counters.
+    State is per process: with several workers each one tracks its own
+    attempts and the last flush wins.
+    """
+
+    def __init__(
+        self,
+        max_failed_attempts: int = 5,
+        lockout_minutes: int = 15,
+        flush_interval: float = 5.0,
+    ) -> None:
+        self._max_failed_attempts = max_failed_attempts
+        self._lockout = timedelta(minutes=lockout_minutes)
+        self._flush_interval = flush_interval
+        self._states: dict[int, _LoginState] = {}
+        self._dirty: set[int] = set()
+        self._evictable: set[int] = set()
+        self._flusher: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        if self._flusher is not None:
+            return
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._flusher = asyncio.create_task(self._flush_periodically())
+        logger.info(
+            f"[LOG:AUTH] - Login tracker started: max_failed_attempts={self._max_failed_attempts}, "
+            f"lockout={self._lockout}, flush_interval={self._flush_interval}s"
+        )
+
+    async def stop(self) -> None:
+        if self._flusher is None or self._wake is None:
+            return
+        # Let the flusher finish its current write instead of cancelling mid-flush
+        self._stopping = True
+        self._wake.set()
+        await self._flusher
+        self._flusher = self._wake = None
+        logger.info("[LOG:AUTH] - Login tracker stopped")
+
+    def locked_until(self, user: User) -> Optional[datetime]:
+        state = self._get_state(user)
+        if state.locked_until is not None and state.locked_until > datetime.now(timezone.utc):
+            return state.locked_until
+        return None
+
+    def record_failure(self, user: User) -> None:
+        state = self._get_state(user)
+        now = datetime.now(timezone.utc)
+        if state.locked_until is not None and state.locked_until <= now:
+            state.failed_attempts = 0
+            state.locked_until = None
+        state.failed_attempts += 1
+        if state.failed_attempts >= self._max_failed_attempts:
+            state.locked_until = now + self._lockout
+            logger.warning(
+                f"[LOG:AUTH] - User locked out: client_id={user.id}, "
+                f"failed_attempts={state.failed_attempts}, locked_until={state.locked_until.isoformat()}"
+            )
+        self._dirty.add(user.id)
+
+    def record_success(self, user: User) -> None:
+        state = self._get_state(user)
+        state.failed_attempts = 0
+        state.locked_until = None
+        state.last_login = datetime.now(timezone.utc)
+        self._dirty.add(user.id)
+
+    async def flush(self) -> None:
+        dirty, self._dirty = self._dirty, set()
+        rows = [
+            {
+                "id": user_id,
+                "failed_attempts": state.failed_attempts,
+                "last_login": state.last_login,
+                "locked_until": state.locked_until,
+            }
+            for user_id in dirty
+            if (state := self._states.get(user_id)) is not None
+        ]
+        if rows:
+            try:
+                async with SessionLocal() as db:
+                    await update_login_stats(db, rows)
+            except Exception as e:
+                self._dirty |= dirty
+                logger.error(f"[LOG:AUTH] - Could not flush login stats: {e}", exc_info=True)
+                return
+            logger.debug(f"[LOG:AUTH] - Flushed login stats: users={len(rows)}")
+        # Entries clean since the previous flush are re-seeded from the row on next login
+        for user_id in self._evictable - dirty - self._dirty:
+            if self._is_clean(user_id):
+                del self._states[user_id]
+        self._evictable = {user_id for user_id in dirty - self._dirty if self._is_clean(user_id)}
+
+    def _is_clean(self, user_id: int) -> bool:
+        state = self._states.get(user_id)
+        return state is not None and state.failed_attempts == 0 and state.locked_until is None
+
+    def _get_state(self, user: User) -> _LoginState:
+        if (state := self._states.get(user.id)) is None:
+            state = self._states[user.id] = _LoginState(
+                failed_attempts=user.failed_attempts or 0,
+                last_login=_as_utc(user.last_login),
+                locked_until=_as_utc(user.locked_until),
+            )
+        return state
+
+    async def _flush_periodically(self) -> None:
+        assert self._wake is not None
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+        # Changes recorded during the last write
+        await self.flush()
+
+
+LOGIN_TRACKER = LoginTracker(
+    max_failed_attempts=int(os.getenv("LOGIN_MAX_FAILED_ATTEMPTS", "5")),
+    lockout_minutes=int(os.getenv("LOGIN_LOCKOUT_MINUTES", "15")),
+    flush_interval=float(os.getenv("LOGIN_FLUSH_INTERVAL", "5")),
+)
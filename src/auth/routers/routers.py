@@ -1,6 +1,14 @@
-from ..keys import JWTRSAProvider
+from ..keys import (
+    JWTRSAProvider,
+    TOKEN_SIGNER,
+)
+from ..audit import AUDIT_WRITER
 from ..global_vars import RABBITMQ_CONFIG
+from ..login_tracker import LOGIN_TRACKER
 from ..sql import (
+    AuditEvent,
+    AuditEventResponse,
+    get_audit_events,
     get_user_by_id,
     get_user_by_username,
     create_user,
@@ -27,12 +35,17 @@ from chassis.sql import get_db
 from fastapi import (
     APIRouter, 
     Depends,
+    Query,
     status,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 import logging
 import socket
-from typing import List
+from typing import (
+    List,
+    Optional,
+)
 
 logger = logging.getLogger(__name__)
 Router = APIRouter(prefix="/auth")
@@ -61,7 +74,10 @@ async def health_check():
     logger.debug(f"[LOG:REST] - GET '/health' served by {container_id}")
     return {
         "detail": f"OK - Served by {container_id}",
-        "system_metrics": get_system_metrics()
+        "system_metrics": {
+            **get_system_metrics(),
+            "token_signer": TOKEN_SIGNER.get_metrics(),
+        }
     }
 
 @Router.get(
@@ -90,7 +106,25 @@ async def login(
     db: AsyncSession = Depends(get_db)
 ):
     maybe_user = await get_user_by_username(db, data.username)
+    if maybe_user is not None and (locked_until := LOGIN_TRACKER.locked_until(maybe_user)) is not None:
+        AUDIT_WRITER.record(AuditEvent.EVENT_LOGIN_FAILED, maybe_user.id, "locked")
+        # Same answer as a wrong password so lockouts do not reveal which usernames exist
+        logger.warning(
+            f"[LOG:REST] - Login rejected, user locked out: client_id={maybe_user.id}, "
+            f"locked_until={locked_until.isoformat()}"
+        )
+        raise_and_log_error(
+            logger,
+            status.HTTP_401_UNAUTHORIZED,
+            message="[LOG:REST] - Invalid credentials"
+        )
+
     if maybe_user is None or not verify_password(data.password, maybe_user.hashed_password):
+        if maybe_user is not None:
+            LOGIN_TRACKER.record_failure(maybe_user)
+            AUDIT_WRITER.record(AuditEvent.EVENT_LOGIN_FAILED, maybe_user.id, "invalid password")
+        else:
+            AUDIT_WRITER.record(AuditEvent.EVENT_LOGIN_FAILED, None, f"unknown username: {data.username}"[:255])
         raise_and_log_error(
             logger,
             status.HTTP_401_UNAUTHORIZED,
@@ -102,10 +136,15 @@ async def login(
     if maybe_user.status == User.STATUS_SUSPENDED:
         raise_and_log_error(logger, status.HTTP_401_UNAUTHORIZED, "[LOG:REST] - User suspended")
 
+    LOGIN_TRACKER.record_success(maybe_user)
+    AUDIT_WRITER.record(AuditEvent.EVENT_LOGIN, maybe_user.id)
+
     logger.info(f"[LOG:REST] - User logged in: client_id={maybe_user.id}, username={maybe_user.username}")
     
-    access_token = JWTRSAProvider.create_access_token(maybe_user.id, maybe_user.role, 15)
-    refresh_token = JWTRSAProvider.create_refresh_token(maybe_user.id, 7)
+    access_token, refresh_token = await asyncio.gather(
+        TOKEN_SIGNER.create_access_token(maybe_user.id, maybe_user.role, 15),
+        TOKEN_SIGNER.create_refresh_token(maybe_user.id, 7),
+    )
 
     return TokenResponse(
         access_token=access_token,
@@ -125,16 +164,19 @@ async def refresh(
         if (maybe_user := await get_user_by_id(db, user_id)) is None:
             raise ValueError("User does not exist")
         
-        new_access = JWTRSAProvider.create_access_token(
-            user_id=maybe_user.id,
-            role=maybe_user.role,
-            minutes=15,
-        )
-        new_refresh = JWTRSAProvider.create_refresh_token(
-            user_id=maybe_user.id,
-            days=7,
+        new_access, new_refresh = await asyncio.gather(
+            TOKEN_SIGNER.create_access_token(
+                user_id=maybe_user.id,
+                role=maybe_user.role,
+                minutes=15,
+            ),
+            TOKEN_SIGNER.create_refresh_token(
+                user_id=maybe_user.id,
+                days=7,
+            ),
         )
         
+        AUDIT_WRITER.record(AuditEvent.EVENT_REFRESH, maybe_user.id)
         logger.info(f"[LOG:REST] - Refresh token created: client_id={user_id}")
 
         return TokenResponse(
@@ -174,6 +216,8 @@ async def register(
         hashed_password=hash_password(data.password)
     )
 
+    AUDIT_WRITER.record(AuditEvent.EVENT_REGISTER, new_user.id, f"role={new_user.role}, by={token_data.get('sub')}")
+
     logger.info(
         "[LOG:REST] - User registered: "
         f"id={new_user.id} username={new_user.username}, role={new_user.role}"
@@ -222,4 +266,43 @@ async def list_users(
             role=user.role,
         )
         for user in users
-    ]
\ No newline at end of file
+    ]
+
+@Router.get(
+    "/audit",
+    response_model=List[AuditEventResponse],
+    summary="List audit events, newest first (admin only)",
+)
+async def list_audit_events(
+    limit: int = Query(50, ge=1, le=500),
+    before_id: Optional[int] = Query(None, description="Return events older than this id (next page cursor)"),
+    user_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+    token_data: dict = Depends(
+        create_jwt_verifier(lambda: JWTRSAProvider.get_public_key_pem(), logger)
+    )
+):
+    logger.debug("[LOG:REST] - GET '/audit' endpoint called.")
+
+    user_role = token_data.get("role")
+    if user_role != "admin":
+        raise_and_log_error(
+            logger,
+            status.HTTP_401_UNAUTHORIZED,
+            f"Access denied: user_role={user_role} (admin required)",
+        )
+
+    events = await get_audit_events(db, limit=limit, before_id=before_id, user_id=user_id)
+
+    logger.info(f"[LOG:REST] - {len(events)} audit events retrieved")
+
+    return [
+        AuditEventResponse(
+            id=event.id,
+            user_id=event.user_id,
+            event=event.event,
+            detail=event.detail,
+            created_at=event.created_at,
+        )
+        for event in events
+    ]
@@ -1,12 +1,21 @@
 from .crud import (
+    create_audit_events,
     create_user,
+    delete_audit_events_before,
+    get_audit_events,
     get_user_by_id,
     get_user_by_username,
     get_users,
+    update_login_stats,
     update_status,
 )
-from .models import User
+from .migrations import add_missing_user_columns
+from .models import (
+    AuditEvent,
+    User,
+)
 from .schemas import (
+    AuditEventResponse,
     LoginRequest,
     Message,
     RefreshRequest,
@@ -16,7 +25,13 @@ from .schemas import (
 )
 
 __all__: list[str] = [
+    "add_missing_user_columns",
+    "AuditEvent",
+    "AuditEventResponse",
+    "create_audit_events",
     "create_user",
+    "delete_audit_events_before",
+    "get_audit_events",
     "get_user_by_id",
     "get_user_by_username",
     "get_users",
@@ -26,6 +41,7 @@ __all__: list[str] = [
     "RegisterRequest",
     "TokenResponse",
     "User",
+    "update_login_stats",
     "update_status",
     "UserResponse",
 ]
\ No newline at end of file
@@ -1,10 +1,16 @@
-from .models import User
+from .models import (
+    AuditEvent,
+    User,
+)
 from chassis.sql import (
     get_element_by_id,
     get_element_statement_result,
     update_elements_statement_result,
 )
+from datetime import datetime
 from sqlalchemy import (
+    delete,
+    insert,
     select,
     update,
 )
@@ -59,4 +65,39 @@ async def update_status(db: AsyncSession, user_id: int, status: str) -> None:
                 .where(User.id == user_id)
                 .values(status=status)
         )
-    )
\ No newline at end of file
+    )
+
+async def update_login_stats(db: AsyncSession, rows: list[dict]) -> None:
+    if not rows:
+        return
+    await db.execute(update(User), rows)
+    await db.commit()
+
+async def create_audit_events(db: AsyncSession, rows: list[dict]) -> None:
+    if not rows:
+        return
+    await db.execute(insert(AuditEvent), rows)
+    await db.commit()
+
+async def get_audit_events(
+    db: AsyncSession,
+    limit: int,
+    before_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+) -> list[AuditEvent]:
+    stmt = select(AuditEvent)
+    if before_id is not None:
+        stmt = stmt.where(AuditEvent.id < before_id)
+    if user_id is not None:
+        stmt = stmt.where(AuditEvent.user_id == user_id)
+    result = await db.execute(stmt.order_by(AuditEvent.id.desc()).limit(limit))
+    return list(result.scalars().all())
+
+async def delete_audit_events_before(db: AsyncSession, cutoff: datetime) -> int:
+    result = await db.execute(
+        delete(AuditEvent)
+            .where(AuditEvent.created_at < cutoff)
+            .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount # type: ignore
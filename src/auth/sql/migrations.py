@@ -0,0 +1,24 @@
+from sqlalchemy import (
+    Connection,
+    text,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Columns added to "user" after the table was first shipped. create_all never
+# alters an existing table, so databases on the persistent volume get them here.
+USER_COLUMNS: dict[str, str] = {
+    "failed_attempts": "INTEGER NOT NULL DEFAULT 0",
+    "last_login": "DATETIME",
+    "locked_until": "DATETIME",
+}
+
+def add_missing_user_columns(conn: Connection) -> None:
+    existing = {row[1] for row in conn.execute(text('PRAGMA table_info("user")'))}
+    if not existing:
+        return
+    for name, ddl in USER_COLUMNS.items():
+        if name not in existing:
+            conn.execute(text(f'ALTER TABLE "user" ADD COLUMN {name} {ddl}'))
+            logger.info(f"[LOG:AUTH] - Added missing column: table=user, column={name}")
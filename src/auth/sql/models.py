@@ -1,9 +1,11 @@
 from chassis.sql import BaseModel
-from sqlalchemy import Integer, String
+from datetime import datetime
+from sqlalchemy import DateTime, Index, Integer, String
 from sqlalchemy.orm import (
     Mapped,
     mapped_column
 )
+from typing import Optional
 
 class User(BaseModel):
     __tablename__ = "user"
@@ -15,4 +17,25 @@ class User(BaseModel):
     role: Mapped[str] = mapped_column(String(10), nullable=False)
     username: Mapped[str] = mapped_column(String(255), nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
-    status: Mapped[str] = mapped_column(String(255), nullable=False)
\ No newline at end of file
+    status: Mapped[str] = mapped_column(String(255), nullable=False)
+    failed_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_login: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    locked_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+class AuditEvent(BaseModel):
+    __tablename__ = "audit_event"
+    __table_args__ = (
+        Index("ix_audit_event_user_id_id", "user_id", "id"),
+    )
+
+    EVENT_LOGIN = "login"
+    EVENT_LOGIN_FAILED = "login_failed"
+    EVENT_REFRESH = "refresh"
+    EVENT_REGISTER = "register"
+    EVENT_SUSPENDED = "suspended"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
+    user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    event: Mapped[str] = mapped_column(String(32), nullable=False)
+    detail: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
@@ -1,7 +1,26 @@
+from datetime import (
+    datetime,
+    timezone,
+)
 from pydantic import (
     BaseModel,
     EmailStr,
+    field_validator,
 )
+from typing import Optional
+
+class AuditEventResponse(BaseModel):
+    id: int
+    user_id: Optional[int]
+    event: str
+    detail: Optional[str]
+    created_at: datetime
+
+    @field_validator("created_at")
+    @classmethod
+    def _as_utc(cls, value: datetime) -> datetime:
+        # SQLite drops the timezone on read
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
 
 class LoginRequest(BaseModel):
     username: str